@@ -9,8 +9,27 @@
 
 import streamlit as st
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from urllib3.exceptions import HTTPError as URLLib3Error
+from concurrent.futures import ThreadPoolExecutor
 import xml.etree.ElementTree as ET
+try:
+    from lxml import etree as LET  # optional: libxml2 parser, faster and tolerant of broken feeds
+except ImportError:
+    LET = None
+try:
+    from selectolax.lexbor import LexborHTMLParser  # optional: strips tags + unescapes in one C pass
+except ImportError:
+    LexborHTMLParser = None
 from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+import collections
+import functools
+import logging
+import operator
+import threading
+import time
 import pandas as pd
 import html
 import re
@@ -35,6 +54,32 @@ ADDITIONAL_FEEDS = [
     # "https://www.thehindubusinessline.com/markets/whatever/rss",
 ]
 
+FETCH_WORKERS = 8
+FEED_SOFT_TTL = 120    # seconds: after this a cached feed is still served, but refreshed in the background
+FEED_HARD_TTL = 1800   # seconds: after this the page waits for a fresh fetch
+
+# Failures a best-effort fetch is expected to hit: network / HTTP (urllib3 errors come through
+# unwrapped when reading r.raw), malformed XML and undecodable payloads (the stdlib parser raises
+# LookupError for an unknown declared encoding). Anything else is a bug.
+FETCH_ERRORS = (requests.RequestException, URLLib3Error, ET.ParseError, ValueError, LookupError)
+if LET is not None:
+    FETCH_ERRORS += (LET.XMLSyntaxError,)
+
+@st.cache_resource
+def http_session():
+    """
+    Shared keep-alive session, kept across Streamlit reruns so fetches reuse pooled connections.
+    Transient gateway errors are retried here instead of surfacing as empty feeds.
+    """
+    s = requests.Session()
+    s.headers["User-Agent"] = "Mozilla/5.0"
+    s.mount("https://", HTTPAdapter(
+        max_retries=Retry(total=2, connect=2, read=1, backoff_factor=0.3, status_forcelist=(502, 503, 504)),
+        pool_connections=16,
+        pool_maxsize=16,
+    ))
+    return s
+
 # ----------------------- CSS (glossy black theme) -----------------------
 st.markdown(
     """
@@ -58,60 +103,118 @@ st.markdown(
 )
 
 # ----------------------- Utilities -----------------------
-def now_ist():
-    return datetime.utcnow().replace(tzinfo=timezone.utc).astimezone(tz=timezone.utc) + IST_OFFSET
+_TAG_RE = re.compile(r'<[^>]+>')  # strips HTML tags from feed text when selectolax isn't installed
+
+def clean_text(s):
+    """Strip HTML tags and unescape entities from feed text (selectolax if installed, else regex + html.unescape)."""
+    if not s:
+        return ""
+    if LexborHTMLParser is not None:
+        # text(strip=True) would glue adjacent nodes together, so strip only the ends
+        return LexborHTMLParser(s).text().strip()
+    return html.unescape(_TAG_RE.sub('', s)).strip()
+
+def iter_xml(r, tag, limit):
+    """
+    Stream-parse a response opened with stream=True and yield at most `limit` <tag> elements.
+    Uses lxml (recover mode) when installed, else stdlib ElementTree. Each element is cleared
+    once the caller moves on, so only about one item is held in memory at a time.
+    """
+    r.raw.decode_content = True  # let urllib3 undo gzip/deflate before the parser sees the bytes
+    if LET is not None:
+        events = LET.iterparse(r.raw, events=("end",), tag=tag, recover=True, huge_tree=False)
+    else:
+        events = ET.iterparse(r.raw, events=("end",))
+    count = 0
+    for _, elem in events:
+        if elem.tag != tag:
+            continue
+        yield elem
+        elem.clear()
+        if LET is not None:
+            # drop processed siblings the parent still references
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        count += 1
+        if count >= limit:
+            break
 
 def parse_rss(url, max_items=10):
-    """Fetch RSS / XML and return list of dicts (title, link, pubDate, summary, source)."""
+    """
+    Fetch RSS / XML and return list of dicts (title, link, pubDate, summary, source).
+    Returns None if the fetch fails, so callers can tell an outage from an empty feed.
+    """
     try:
-        r = requests.get(url, timeout=6, headers={"User-Agent": "Mozilla/5.0"})
-        if r.status_code != 200:
-            return []
-        content = r.content
-        root = ET.fromstring(content)
-        items = []
-        for elem in root.findall(".//item")[:max_items]:
-            title = elem.findtext("title") or ""
-            link = elem.findtext("link") or ""
-            pub = elem.findtext("pubDate") or elem.findtext("published") or ""
-            desc = elem.findtext("description") or elem.findtext("summary") or ""
-            items.append({
-                "title": html.unescape(title.strip()),
-                "link": link.strip(),
-                "published": pub.strip(),
-                "summary": re.sub(r'<[^>]+>', '', desc).strip(),
-            })
-        return items
-    except Exception:
-        return []
+        with http_session().get(url, timeout=(2, 6), stream=True) as r:
+            if r.status_code != 200:
+                return None
+            items = []
+            for elem in iter_xml(r, "item", max_items):
+                title = elem.findtext("title") or ""
+                link = elem.findtext("link") or ""
+                pub = elem.findtext("pubDate") or elem.findtext("published") or ""
+                desc = elem.findtext("description") or elem.findtext("summary") or ""
+                items.append({
+                    "title": clean_text(title),
+                    "link": link.strip(),
+                    "published": pub.strip(),
+                    "summary": clean_text(desc),
+                })
+            return items
+    except FETCH_ERRORS:
+        return None
+
+# only the quote fields we read below; keeps Yahoo's response (and json parse) small
+QUOTE_FIELDS = (
+    "shortName", "longName", "regularMarketPrice", "regularMarketPreviousClose",
+    "regularMarketChange", "regularMarketChangePercent", "regularMarketTime",
+)
 
-def fetch_yahoo_quote(symbol):
+def quote_time(ts):
+    """Datetime for a Yahoo regularMarketTime epoch; the current time if it is missing or unusable."""
+    if ts and isinstance(ts, (int, float)):
+        try:
+            return datetime.fromtimestamp(ts)
+        except (OverflowError, OSError, ValueError):
+            pass  # out of range for the platform (or NaN)
+    return datetime.fromtimestamp(datetime.utcnow().timestamp())
+
+@st.cache_data(ttl=30, max_entries=64, show_spinner=False)
+def fetch_yahoo_quotes(symbols):
     """
-    Fetch real-time-ish quote from Yahoo Finance public endpoint.
-    Returns dict with price, change, percent, time. Works for equities and indices.
+    Fetch real-time-ish quotes for all symbols in one call to the Yahoo Finance public endpoint.
+    Returns {SYMBOL (upper-cased): dict with price, change, percent, time}; unknown symbols are absent.
+    Works for equities and indices.
     """
+    if not symbols:
+        return {}
     try:
         # Yahoo API accepts comma-separated symbols. Careful with special chars.
-        safe = requests.utils.quote(symbol)
-        url = f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={safe}"
-        r = requests.get(url, timeout=5, headers={"User-Agent": "Mozilla/5.0"})
+        safe = requests.utils.quote(",".join(symbols))
+        url = f"https://query1.finance.yahoo.com/v7/finance/quote?symbols={safe}&fields={','.join(QUOTE_FIELDS)}"
+        r = http_session().get(url, timeout=(2, 5))
         js = r.json()
-        q = js.get("quoteResponse", {}).get("result", [])
-        if not q:
-            return None
-        q0 = q[0]
-        return {
-            "symbol": q0.get("symbol"),
-            "shortName": q0.get("shortName") or q0.get("longName"),
-            "price": q0.get("regularMarketPrice"),
-            "previousClose": q0.get("regularMarketPreviousClose"),
-            "change": q0.get("regularMarketChange"),
-            "percent": q0.get("regularMarketChangePercent"),
-            "time": datetime.fromtimestamp(q0.get("regularMarketTime") or datetime.utcnow().timestamp())
-        }
-    except Exception:
-        return None
+        # payload shape isn't guaranteed (nulls, error objects, lists): treat anything unexpected as no quotes
+        resp = js.get("quoteResponse") if isinstance(js, dict) else None
+        results = (resp.get("result") if isinstance(resp, dict) else None) or []
+        quotes = {}
+        for q0 in results:
+            if not isinstance(q0, dict):
+                continue
+            quotes[(q0.get("symbol") or "").upper()] = {
+                "symbol": q0.get("symbol"),
+                "shortName": q0.get("shortName") or q0.get("longName"),
+                "price": q0.get("regularMarketPrice"),
+                "previousClose": q0.get("regularMarketPreviousClose"),
+                "change": q0.get("regularMarketChange"),
+                "percent": q0.get("regularMarketChangePercent"),
+                "time": quote_time(q0.get("regularMarketTime")),
+            }
+        return quotes
+    except FETCH_ERRORS:
+        return {}
 
+@st.cache_data(ttl=300, show_spinner=False)
 def fetch_bse_announcements(limit=10):
     """
     Best-effort attempt to fetch corporate filings/announcements from BSE XML endpoint.
@@ -119,20 +222,91 @@ def fetch_bse_announcements(limit=10):
     """
     url = "https://www.bseindia.com/xml-data/corpfiling/Equity/Equity.xml"
     try:
-        r = requests.get(url, timeout=6, headers={"User-Agent": "Mozilla/5.0"})
-        if r.status_code != 200:
-            return []
-        root = ET.fromstring(r.content)
-        # sample structure parsing may differ; we'll attempt to locate announcement nodes
-        items = []
-        for ann in root.findall(".//Announcement")[:limit]:
-            title = ann.findtext("Subject") or ann.findtext("Head") or "Announcement"
-            date = ann.findtext("Dt") or ann.findtext("Date")
-            link = ann.findtext("URL") or ""
-            items.append({"title": title, "date": date, "link": link})
+        with http_session().get(url, timeout=(2, 6), stream=True) as r:
+            if r.status_code != 200:
+                return []
+            # sample structure parsing may differ; we'll attempt to locate announcement nodes
+            items = []
+            for ann in iter_xml(r, "Announcement", limit):
+                title = ann.findtext("Subject") or ann.findtext("Head") or "Announcement"
+                date = ann.findtext("Dt") or ann.findtext("Date")
+                link = ann.findtext("URL") or ""
+                items.append({"title": title, "date": date, "link": link})
+            return items
+    except FETCH_ERRORS:
+        return []
+
+@st.cache_resource
+def feed_store():
+    """Feed cache shared across reruns: (url, max_items) -> (fetched_at, items), plus keys being refreshed."""
+    return {"entries": {}, "refreshing": set(), "lock": threading.Lock()}
+
+def refresh_feed(url, max_items=10):
+    """
+    Fetch one feed with parse_rss and store it in feed_store(); returns the items.
+    A failed fetch keeps (and returns) the existing entry untouched, so stale items keep being
+    served while the source is down; [] is only stored when there is nothing older to fall back on.
+    """
+    key = (url, max_items)
+    store = feed_store()
+    try:
+        items = parse_rss(url, max_items=max_items)
+        with store["lock"]:
+            if items is None:
+                entry = store["entries"].get(key)
+                if entry is not None:
+                    return entry[1]
+                items = []
+            store["entries"][key] = (time.time(), items)
         return items
     except Exception:
-        return []
+        # background refreshes have no caller to surface this to; log it, keep the stale entry
+        logging.getLogger(__name__).exception("refreshing feed %s failed", url)
+        raise
+    finally:
+        with store["lock"]:
+            store["refreshing"].discard(key)
+
+def fetch_feed(url, max_items=10):
+    """
+    Stale-while-revalidate read of one feed. Entries younger than FEED_SOFT_TTL are returned as is;
+    older ones are still returned immediately while a background refresh runs on fetch_executor();
+    only missing entries or ones past FEED_HARD_TTL are fetched before returning.
+    The returned items are shared between sessions, so callers must not modify them.
+    """
+    key = (url, max_items)
+    store = feed_store()
+    with store["lock"]:
+        entry = store["entries"].get(key)
+        if entry is not None:
+            age = time.time() - entry[0]
+            if age <= FEED_HARD_TTL:
+                if age > FEED_SOFT_TTL and key not in store["refreshing"]:
+                    store["refreshing"].add(key)
+                    fetch_executor().submit(refresh_feed, url, max_items)
+                return entry[1]
+    return refresh_feed(url, max_items)
+
+@st.cache_data(ttl=60, max_entries=32, show_spinner=False)
+def fetch_news(feed_urls, max_items=10):
+    """
+    Fetch all feed URLs concurrently; returns one parse_rss() result list per URL, in order.
+    Articles are tagged here so the tags are cached along with them across reruns.
+    """
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as ex:
+        shared = list(ex.map(lambda u: fetch_feed(u, max_items=max_items), feed_urls))
+    # copy before annotating: fetch_feed's items are shared across sessions
+    results = [[dict(it) for it in items] for items in shared]
+    for items in results:
+        for it in items:
+            it["_search"] = f"{it['title']} {it['summary']}".lower()
+            it["_tags"] = tag_article(it["_search"])
+    return results
+
+@st.cache_resource
+def fetch_executor():
+    """Thread pool shared across reruns for running the page's independent fetches side by side."""
+    return ThreadPoolExecutor(max_workers=FETCH_WORKERS)
 
 # Simple heuristics to tag geopolitical / macro / action items
 GEO_KEYWORDS = [
@@ -142,49 +316,64 @@ GEO_KEYWORDS = [
 MACRO_KEYWORDS = ["inflation", "cpi", "gdp", "unemployment", "rate cut", "rate hike", "interest rate", "rbi", "fed"]
 ACTION_KEYWORDS = ["dividend", "buyback", "board", "merger", "acquisition", "ipo", "rights issue", "debt"]
 
-def tag_article(text):
-    txt = (text or "").lower()
-    tags = []
-    if any(k in txt for k in GEO_KEYWORDS):
-        tags.append("Geopolitical")
-    if any(k in txt for k in MACRO_KEYWORDS):
-        tags.append("Macro")
-    if any(k in txt for k in ACTION_KEYWORDS):
-        tags.append("Corporate Action")
-    return tags or ["General"]
+TAG_CATEGORIES = {
+    "Geopolitical": GEO_KEYWORDS,
+    "Macro": MACRO_KEYWORDS,
+    "Corporate Action": ACTION_KEYWORDS,
+}
+# one bit per category; the tag tuple for every bit combination is built once up front
+CATEGORY_BIT = {cat: 1 << i for i, cat in enumerate(TAG_CATEGORIES)}
+_KEYWORDS_BY_BIT = tuple((CATEGORY_BIT[cat], tuple(kws)) for cat, kws in TAG_CATEGORIES.items())
+ALL_CATEGORIES_MASK = (1 << len(TAG_CATEGORIES)) - 1
+_TAGS_BY_MASK = [
+    tuple(cat for cat, bit in CATEGORY_BIT.items() if mask & bit) or ("General",)
+    for mask in range(ALL_CATEGORIES_MASK + 1)
+]
+
+@functools.lru_cache(maxsize=4096)
+def tag_article(txt):
+    """Return the impact tags for an article's search text, which must already be lower-cased."""
+    txt = txt or ""
+    mask = 0
+    # plain `in` checks run in C and beat a regex alternation over the same keywords
+    for bit, kws in _KEYWORDS_BY_BIT:
+        if any(k in txt for k in kws):
+            mask |= bit
+    return _TAGS_BY_MASK[mask]  # shared tuples, safe to hand out from the cache
 
+@functools.lru_cache(maxsize=2048)
+def parse_published(pub_dt_str):
+    """
+    Parse an RSS (RFC 822) or ISO-8601 timestamp into an aware datetime; naive values are taken as UTC.
+    Returns None if the string can't be parsed.
+    """
+    if not pub_dt_str:
+        return None
+    try:
+        pub = parsedate_to_datetime(pub_dt_str)
+    except (TypeError, ValueError):
+        try:
+            pub = datetime.fromisoformat(pub_dt_str.replace("Z", "+00:00"))
+        except ValueError:
+            return None
+    if pub.tzinfo is None:
+        pub = pub.replace(tzinfo=timezone.utc)
+    return pub
+
+@functools.lru_cache(maxsize=4096)
 def is_after_hours(pub_dt_str):
     """
-    Try to parse pub_dt_str for known formats; treat it as after-hours if published after 15:30 IST.
+    Treat an article as after-hours if published after 15:30 IST.
     If parsing fails, return False (conservative).
     """
-    try:
-        # try common RFC formats
-        pub = None
-        for fmt in ("%a, %d %b %Y %H:%M:%S %Z", "%a, %d %b %Y %H:%M:%S %z", "%Y-%m-%dT%H:%M:%SZ", "%Y-%m-%d %H:%M:%S"):
-            try:
-                pub = datetime.strptime(pub_dt_str, fmt)
-                break
-            except Exception:
-                continue
-        if pub is None:
-            # fallback: find digits
-            m = re.search(r"(\d{2}:\d{2}:\d{2})", pub_dt_str)
-            if not m:
-                return False
-            # assume today's date
-            today = now_ist().date()
-            hms = m.group(1)
-            pub = datetime.combine(today, datetime.strptime(hms, "%H:%M:%S").time())
-        # convert to IST if naive (we'll assume UTC if naive) — approximate
-        if pub.tzinfo is None:
-            pub_utc = pub.replace(tzinfo=timezone.utc)
-            pub_ist = pub_utc.astimezone(timezone.utc) + IST_OFFSET
-        else:
-            pub_ist = pub.astimezone(timezone.utc) + IST_OFFSET
-        return (pub_ist.hour, pub_ist.minute) >= MARKET_CLOSE_IST
-    except Exception:
+    pub = parse_published(pub_dt_str)
+    if pub is None:
         return False
+    try:
+        pub_ist = pub.astimezone(timezone.utc) + IST_OFFSET
+    except (OverflowError, ValueError):
+        return False  # parseable but out of datetime range once shifted (e.g. year 1 / 9999 with an offset)
+    return (pub_ist.hour, pub_ist.minute) >= MARKET_CLOSE_IST
 
 # ----------------------- UI -----------------------
 st.title("EliteMarket — Professional Live Finance Dashboard")
@@ -193,24 +382,39 @@ st.markdown("Aggregates live quotes, multi-source financial news, corporate anno
 # Sidebar controls
 with st.sidebar:
     st.header("Controls")
-    symbols_input = st.text_input("Tickers / Indices (comma separated)", value="NSEI, ^BSESN, TCS.NS, RELIANCE.NS, ITC.NS")
+    # edits only take effect (and rerun the page) when "Apply" is pressed, not on every widget change
+    with st.form("controls"):
+        symbols_input = st.text_input("Tickers / Indices (comma separated)", value="NSEI, ^BSESN, TCS.NS, RELIANCE.NS, ITC.NS")
+        st.markdown("---")
+        st.subheader("News feeds")
+        feeds_checked = st.multiselect("Select sources to include", options=list(RSS_FEEDS.keys()), default=list(RSS_FEEDS.keys()))
+        st.number_input("Articles per source", min_value=3, max_value=30, value=10, key="articles_per")
+        st.checkbox("Show only after-market articles", key="after_hours", value=False)
+        st.checkbox("Highlight Geopolitical / Macro / Corporate actions", key="highlight_tags", value=True)
+        st.form_submit_button("Apply")
     symbols = [s.strip() for s in symbols_input.split(",") if s.strip()]
     st.markdown("---")
-    st.subheader("News feeds")
-    feeds_checked = st.multiselect("Select sources to include", options=list(RSS_FEEDS.keys()), default=list(RSS_FEEDS.keys()))
-    st.number_input("Articles per source", min_value=3, max_value=30, value=10, key="articles_per")
-    st.checkbox("Show only after-market articles", key="after_hours", value=False)
-    st.checkbox("Highlight Geopolitical / Macro / Corporate actions", key="highlight_tags", value=True)
-    st.markdown("---")
+    if st.button("Force refresh", help="Ignore cached quotes / news and fetch again"):
+        feed_store.clear()
+        fetch_news.clear()
+        fetch_bse_announcements.clear()
+        fetch_yahoo_quotes.clear()
     st.caption("Note: For full enterprise data (real-time tick-by-tick, official corporate filings), use licensed APIs. See README for how to add keys to Streamlit Secrets.")
 
+# Start quotes, news and BSE announcements together; each section below waits only for its own result.
+# (fetch_news fans out on its own short-lived pool, so shared-pool workers never wait on each other.)
+pool = fetch_executor()
+feed_names = [f for f in feeds_checked if RSS_FEEDS.get(f)]
+quotes_future = pool.submit(fetch_yahoo_quotes, tuple(symbols))
+news_future = pool.submit(fetch_news, tuple(RSS_FEEDS[f] for f in feed_names), max_items=st.session_state.articles_per)
+bse_future = pool.submit(fetch_bse_announcements, limit=8)
+
 # Top row: live quotes
 st.subheader("Live Quotes")
 quote_cols = st.columns(len(symbols) if symbols else 1)
-quotes = []
-for i, s in enumerate(symbols):
-    q = fetch_yahoo_quote(s)
-    quotes.append(q)
+quotes_by_symbol = quotes_future.result()
+quotes = [quotes_by_symbol.get(s.upper()) for s in symbols]
+for i, (s, q) in enumerate(zip(symbols, quotes)):
     c = quote_cols[i]
     if q:
         pct = q.get("percent")
@@ -221,17 +425,10 @@ for i, s in enumerate(symbols):
 
 # Middle: consolidated market data table (DataFrame)
 st.subheader("Market Snapshot Table")
-snap_rows = []
-for q in quotes:
-    if q:
-        snap_rows.append({
-            "Symbol": q.get("symbol"),
-            "Name": q.get("shortName"),
-            "Price": q.get("price"),
-            "Change": q.get("change"),
-            "Change %": q.get("percent")
-        })
-snap_df = pd.DataFrame(snap_rows)
+SNAPSHOT_COLUMNS = {"symbol": "Symbol", "shortName": "Name", "price": "Price", "change": "Change", "percent": "Change %"}
+# build column-wise (dict of lists) so pandas doesn't have to pivot row dicts
+snap_quotes = [q for q in quotes if q]
+snap_df = pd.DataFrame({label: [q.get(field) for q in snap_quotes] for field, label in SNAPSHOT_COLUMNS.items()})
 st.dataframe(snap_df, use_container_width=True)
 
 # News aggregation
@@ -241,62 +438,62 @@ col_left, col_right = st.columns([2, 1])
 with col_left:
     st.markdown("### Aggregated News")
     NEWS = []
-    # gather feeds selected
-    for feed_name in feeds_checked:
-        url = RSS_FEEDS.get(feed_name)
-        if not url:
-            continue
-        items = parse_rss(url, max_items=st.session_state.articles_per)
+    # gather feeds selected (fetched concurrently)
+    for feed_name, items in zip(feed_names, news_future.result()):
         for it in items:
             it["source"] = feed_name
         NEWS.extend(items)
 
     # AMFI / BSE attempts
     # BSE corporate XML
-    bse_anns = fetch_bse_announcements(limit=8)
+    bse_anns = bse_future.result()
     for a in bse_anns:
         NEWS.append({"title": a.get("title"), "link": a.get("link"), "published": a.get("date"), "summary": "", "source": "BSE Announcements"})
 
-    # sort by published (best-effort) — if published missing, push to end
-    def pub_key(x):
-        p = x.get("published") or ""
-        return p
-    NEWS = sorted(NEWS, key=pub_key, reverse=True)
+    # sort newest first by parsed publish time (computed once per item) — unparseable/missing go to the end
+    for n in NEWS:
+        pub = parse_published(n.get("published"))
+        n["_ts"] = pub.timestamp() if pub else 0.0
+    NEWS.sort(key=operator.itemgetter("_ts"), reverse=True)
 
     # filter after-hours if requested
     if st.session_state.after_hours:
         NEWS = [n for n in NEWS if is_after_hours(n.get("published", ""))]
 
-    # remove duplicates (same title)
-    seen = set()
-    NEWS_UNIQ = []
+    # remove duplicates (same title, ignoring case and whitespace); first occurrence wins, order kept
+    NEWS_UNIQ = {}
     for item in NEWS:
-        t = item.get("title") or ""
-        if t in seen:
-            continue
-        seen.add(t)
-        NEWS_UNIQ.append(item)
-    NEWS = NEWS_UNIQ
+        NEWS_UNIQ.setdefault(" ".join((item.get("title") or "").split()).casefold(), item)
+    NEWS = list(NEWS_UNIQ.values())
+
+    # feed articles arrive tagged from fetch_news; tag the rest (BSE) once here for display + summary
+    for n in NEWS:
+        if "_tags" not in n:
+            n["_search"] = f"{n.get('title') or ''} {n.get('summary') or ''}".lower()
+            n["_tags"] = tag_article(n["_search"])
 
     # display
     if not NEWS:
         st.info("No articles available. Check internet or change sources.")
     else:
+        # render the whole list as one HTML block: one Streamlit element instead of ~5 per article.
+        # Feed text is untrusted, so everything is escaped and only http(s) links are kept.
+        parts = []
         for n in NEWS[:60]:
-            title = n.get("title")
-            link = n.get("link")
-            pub = n.get("published")
-            summary = n.get("summary") or ""
-            source = n.get("source", "News")
-            tags = tag_article(f"{title} {summary}")
-
-            st.markdown(f"#### [{title}]({link})")
-            st.caption(f"{source} • {pub}")
+            title = html.escape(n.get("title") or "")
+            link = n.get("link") or ""
+            href = html.escape(link) if link.startswith(("http://", "https://")) else "#"
+            pub = html.escape(n.get("published") or "")
+            summary = html.escape(n.get("summary") or "")
+            source = html.escape(n.get("source", "News"))
+
+            part = f"<h4><a href='{href}'>{title}</a></h4><small>{source} • {pub}</small>"
             if summary:
-                st.write(summary)
+                part += f"<p>{summary}</p>"
             if st.session_state.highlight_tags:
-                st.markdown("**Tags:** " + ", ".join(f"`{t}`" for t in tags))
-            st.markdown("---")
+                part += "<p><b>Tags:</b> " + ", ".join(f"<code>{t}</code>" for t in n["_tags"]) + "</p>"
+            parts.append(f"<div>{part}<hr></div>")
+        st.markdown("\n".join(parts), unsafe_allow_html=True)
 
 with col_right:
     st.markdown("### Corporate Announcements (BSE / NSE sample)")
@@ -322,15 +519,13 @@ with col_right:
 
 # Bottom: geopolitical + impact summary
 st.subheader("Macro / Geopolitical Impact Summary (auto flagged)")
-# aggregate tags counts
-tag_counts = {}
-for n in NEWS:
-    for t in tag_article((n.get("title") or "") + " " + (n.get("summary") or "")):
-        tag_counts[t] = tag_counts.get(t, 0) + 1
+# aggregate tags counts (reuses the per-article tags, no second keyword scan)
+tag_counts = collections.Counter(t for n in NEWS for t in n["_tags"])
 if not tag_counts:
     st.write("No significant tags detected.")
 else:
-    st.table(pd.DataFrame(list(tag_counts.items()), columns=["Tag", "Count"]))
+    # at most four rows of our own tag names: a markdown table skips the Arrow round-trip of st.table
+    st.markdown("| Tag | Count |\n|---|---|\n" + "\n".join(f"| {t} | {c} |" for t, c in tag_counts.items()))
 
 # Footer: How to plug paid APIs (instructions)
 st.markdown("---")